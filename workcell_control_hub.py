@@ -17,62 +17,215 @@ This GUI integrates concepts from multiple automation projects:
 """
 
 import sys
-from datetime import datetime
+import time
+from collections import deque
+from functools import partial
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit, QGroupBox, QGridLayout, QComboBox,
-    QProgressBar, QTabWidget, QTableWidget, QTableWidgetItem, QMessageBox,
+    QLabel, QPushButton, QPlainTextEdit, QGroupBox, QGridLayout, QComboBox,
+    QProgressBar, QTabWidget, QTableView, QMessageBox,
     QStatusBar, QCheckBox, QSpinBox
 )
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QThread
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import (
+    QTimer, Qt, pyqtSignal, QObject, QAbstractTableModel, QModelIndex
+)
+from PyQt5.QtGui import QFont, QColor, QTextCursor
 import random
 
 
-class DeviceSimulationThread(QThread):
-    """Background thread for simulating device operations"""
+# Formatted wall-clock time, recomputed at most once per second
+_ts_cache = [0, '']
+
+
+def _now_hms():
+    """Return the current time as HH:MM:SS"""
+    s = int(time.time())
+    c = _ts_cache
+    if c[0] != s:
+        c[0] = s
+        c[1] = time.strftime('%H:%M:%S', time.localtime(s))
+    return c[1]
+
+
+# Activity log line templates per level, filled with timestamp and message
+_LOG_COLORS = {
+    "INFO": "black",
+    "WARNING": "orange",
+    "ERROR": "red",
+    "SUCCESS": "green",
+    "DEVICE": "blue"
+}
+_LOG_TPL = {
+    lvl: f'<span style="color: {c};">[{{t}}] {lvl}: {{m}}</span>'
+    for lvl, c in _LOG_COLORS.items()
+}
+_LOG_TPL_DEFAULT = '<span style="color: black;">[{t}] {lvl}: {m}</span>'
+
+# Device status label styles
+_CSS_GREEN = (
+    "background-color: #90EE90; padding: 8px; "
+    "border-radius: 4px; min-width: 150px;"
+)
+_CSS_BLUE = (
+    "background-color: #87CEEB; padding: 8px; "
+    "border-radius: 4px; min-width: 150px;"
+)
+_CSS_PINK = (
+    "background-color: #FFB6C6; padding: 8px; "
+    "border-radius: 4px; min-width: 150px;"
+)
+_CSS_YELLOW = (
+    "background-color: #FFFFE0; padding: 8px; "
+    "border-radius: 4px; min-width: 150px;"
+)
+_STATUS_CSS = {
+    'Ready': _CSS_GREEN,
+    'Idle': _CSS_GREEN,
+    'Active': _CSS_BLUE,
+    'Stopped': _CSS_PINK,
+}
+
+
+class DeviceSim(QObject):
+    """Timer-driven simulation of a device operation on the GUI event loop"""
     status_update = pyqtSignal(str, str, int)  # device_name, status, progress
     log_message = pyqtSignal(str, str)  # message, level
+    finished = pyqtSignal()
     
-    def __init__(self, device_name, operation):
-        super().__init__()
+    STEPS = 10
+    STEP_MS = 500  # 0.5 second per step
+    
+    __slots__ = ('device_name', 'operation', 'step', 'is_running', '_last_bucket')
+    
+    def __init__(self, device_name, operation, parent=None):
+        super().__init__(parent)
         self.device_name = device_name
         self.operation = operation
+        self.step = 0
+        self.is_running = False
+        self._last_bucket = -1
+        
+    def start(self):
+        """Begin the operation; the first step is emitted immediately"""
         self.is_running = True
+        self.tick()
         
-    def run(self):
-        """Simulate device operation with progress updates"""
-        steps = 10
-        for i in range(steps + 1):
-            if not self.is_running:
-                self.status_update.emit(self.device_name, "Stopped", 0)
-                return
-                
-            progress = int((i / steps) * 100)
-            self.status_update.emit(self.device_name, "Active", progress)
+    def tick(self):
+        """Emit progress for the current step and schedule the next one"""
+        if not self.is_running:
+            self.status_update.emit(self.device_name, "Stopped", 0)
+            self.finished.emit()
+            return
             
-            if i == steps // 2:
-                self.log_message.emit(
-                    f"{self.device_name}: {self.operation} 50% complete",
-                    "INFO"
-                )
+        if self.step > self.STEPS:
+            self.is_running = False
+            self.status_update.emit(self.device_name, "Ready", 100)
+            self.log_message.emit(
+                f"{self.device_name}: {self.operation} completed successfully",
+                "SUCCESS"
+            )
+            self.finished.emit()
+            return
             
-            self.msleep(500)  # 0.5 second per step
+        # Only report progress on 20% boundaries to cut signal traffic
+        progress = int((self.step / self.STEPS) * 100)
+        bucket = progress // 20
+        if bucket != self._last_bucket:
+            self._last_bucket = bucket
+            self.status_update.emit(self.device_name, "Active", progress)
         
-        self.status_update.emit(self.device_name, "Ready", 100)
-        self.log_message.emit(
-            f"{self.device_name}: {self.operation} completed successfully",
-            "SUCCESS"
-        )
+        if self.step == self.STEPS // 2:
+            self.log_message.emit(
+                f"{self.device_name}: {self.operation} 50% complete",
+                "INFO"
+            )
+        
+        self.step += 1
+        QTimer.singleShot(self.STEP_MS, self.tick)
     
     def stop(self):
         self.is_running = False
 
 
+class SampleModel(QAbstractTableModel):
+    """Table model for tracked samples, stored as one list per column"""
+    _HEADERS = ('Sample ID', 'Type', 'Location', 'Status', 'Last Updated')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = []
+        self.types = []
+        self.locations = []
+        self.statuses = []
+        self.timestamps = []
+        self._columns = (
+            self.ids, self.types, self.locations, self.statuses, self.timestamps
+        )
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._columns[index.column()][index.row()]
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._columns[index.column()][index.row()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+        
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def add_many(self, ids, types, locations, status, timestamp):
+        """Append a batch of samples sharing a status and timestamp"""
+        if not ids:
+            return
+        base = len(self.ids)
+        self.beginInsertRows(QModelIndex(), base, base + len(ids) - 1)
+        self.ids.extend(ids)
+        self.types.extend(types)
+        self.locations.extend(locations)
+        self.statuses.extend([status] * len(ids))
+        self.timestamps.extend([timestamp] * len(ids))
+        self.endInsertRows()
+
+
 class WorkcellControlHub(QMainWindow):
+    # Protocol steps as (device, operation)
+    _PROTOCOL_STEPS = (
+        ('Transport Robot', 'Retrieving samples from storage'),
+        ('Liquid Handler', 'Dispensing reagents'),
+        ('Incubator', 'Incubating samples'),
+        ('Centrifuge', 'Centrifuging samples'),
+        ('Plate Reader', 'Reading plate'),
+        ('Transport Robot', 'Returning samples to storage')
+    )
+    
+    # Oldest activity log lines are dropped beyond this count
+    _LOG_MAX_BLOCKS = 2000
+    
+    # Test sample attributes
+    _SAMPLE_TYPES = ('CHO Clone', 'Media Sample', 'Assay Plate', 'QC Sample')
+    _LOCATIONS = ('Incubator A', 'Storage -80C', 'Workcell 1', 'Reader Station')
+    
     def __init__(self):
         super().__init__()
         
+        # Shared fonts (QFont needs a QApplication, so not at class level)
+        self._bold_11 = QFont('Arial', 11, QFont.Bold)
+        
         # Device states
         self.devices = {
             'Transport Robot': {'status': 'Idle', 'progress': 0},
@@ -83,25 +236,33 @@ class WorkcellControlHub(QMainWindow):
             'Storage Unit': {'status': 'Ready', 'progress': 0}
         }
         
-        # Active device threads
+        # Active device simulations
         self.device_threads = {}
+        self._active_ops = 0
         
         # Protocol execution state
         self.protocol_running = False
         self.current_step = 0
         
         # Sample tracking
-        self.samples = []
+        self.samples = SampleModel()
+        
+        # Pending log lines, flushed to the display in batches
+        self._log_buf = deque(maxlen=2000)
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         
         self.init_ui()
         
         # Status bar updates
         self.statusBar().showMessage('System Ready')
         
-        # Periodic updates
+        # Periodic updates, only run while operations are active
         self.timer = QTimer()
+        self.timer.setInterval(5000)  # Every 5 seconds
         self.timer.timeout.connect(self.periodic_update)
-        self.timer.start(5000)  # Every 5 seconds
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -123,14 +284,16 @@ class WorkcellControlHub(QMainWindow):
         # Tab 1: Device Monitoring
         self.tabs.addTab(self.create_device_monitor_tab(), "Device Monitor")
         
-        # Tab 2: Protocol Execution
-        self.tabs.addTab(self.create_protocol_tab(), "Protocol Manager")
-        
-        # Tab 3: Sample Tracking
-        self.tabs.addTab(self.create_sample_tracking_tab(), "Sample Tracking")
-        
-        # Tab 4: System Integration
-        self.tabs.addTab(self.create_integration_tab(), "System Integration")
+        # Tabs 2-4 start as placeholders and are built on first view
+        self.tabs.addTab(QWidget(), "Protocol Manager")
+        self.tabs.addTab(QWidget(), "Sample Tracking")
+        self.tabs.addTab(QWidget(), "System Integration")
+        self._tab_builders = {
+            1: self.create_protocol_tab,
+            2: self.create_sample_tracking_tab,
+            3: self.create_integration_tab
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
         main_layout.addWidget(self.tabs)
         
@@ -144,6 +307,23 @@ class WorkcellControlHub(QMainWindow):
         self.log_message("Workcell Control Hub initialized", "SUCCESS")
         self.log_message("All devices connected and ready", "INFO")
         
+    def _ensure_tab(self, idx):
+        """Replace a placeholder tab with its real contents"""
+        builder = self._tab_builders.pop(idx, None)
+        if builder is None:
+            return
+            
+        title = self.tabs.tabText(idx)
+        placeholder = self.tabs.widget(idx)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(idx)
+            self.tabs.insertTab(idx, builder(), title)
+            self.tabs.setCurrentIndex(idx)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
     def create_header(self):
         """Create header section"""
         header_widget = QWidget()
@@ -187,15 +367,14 @@ class WorkcellControlHub(QMainWindow):
         for device_name in self.devices.keys():
             # Device name
             name_label = QLabel(device_name + ":")
-            name_label.setFont(QFont('Arial', 11, QFont.Bold))
+            name_label.setFont(self._bold_11)
             device_layout.addWidget(name_label, row, 0)
             
             # Status label
             status_label = QLabel(self.devices[device_name]['status'])
-            status_label.setStyleSheet(
-                "background-color: #90EE90; padding: 8px; "
-                "border-radius: 4px; min-width: 150px;"
-            )
+            status_label.setStyleSheet(_CSS_GREEN)
+            status_label.setProperty('_css', _CSS_GREEN)
+            status_label.setProperty('_last_status', self.devices[device_name]['status'])
             device_layout.addWidget(status_label, row, 1)
             self.status_labels[device_name] = status_label
             
@@ -207,9 +386,7 @@ class WorkcellControlHub(QMainWindow):
             
             # Manual control button
             control_btn = QPushButton('Test Device')
-            control_btn.clicked.connect(
-                lambda checked, d=device_name: self.test_device(d)
-            )
+            control_btn.clicked.connect(partial(self.test_device, device_name))
             device_layout.addWidget(control_btn, row, 3)
             
             row += 1
@@ -335,11 +512,8 @@ class WorkcellControlHub(QMainWindow):
         table_group = QGroupBox("Active Samples")
         table_layout = QVBoxLayout()
         
-        self.sample_table = QTableWidget()
-        self.sample_table.setColumnCount(5)
-        self.sample_table.setHorizontalHeaderLabels([
-            'Sample ID', 'Type', 'Location', 'Status', 'Last Updated'
-        ])
+        self.sample_table = QTableView()
+        self.sample_table.setModel(self.samples)
         self.sample_table.horizontalHeader().setStretchLastSection(True)
         table_layout.addWidget(self.sample_table)
         
@@ -417,8 +591,9 @@ class WorkcellControlHub(QMainWindow):
         group = QGroupBox("Activity Log")
         layout = QVBoxLayout()
         
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(self._LOG_MAX_BLOCKS)
         self.log_display.setMaximumHeight(150)
         layout.addWidget(self.log_display)
         
@@ -435,27 +610,44 @@ class WorkcellControlHub(QMainWindow):
         
     def log_message(self, message, level="INFO"):
         """Add timestamped message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        color_map = {
-            "INFO": "black",
-            "WARNING": "orange",
-            "ERROR": "red",
-            "SUCCESS": "green",
-            "DEVICE": "blue"
-        }
+        tpl = _LOG_TPL.get(level, _LOG_TPL_DEFAULT)
+        formatted_msg = tpl.format(
+            t=_now_hms(), lvl=level, m=message
+        )
         
-        color = color_map.get(level, "black")
-        formatted_msg = f'<span style="color: {color};">[{timestamp}] {level}: {message}</span>'
+        self._log_buf.append(formatted_msg)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
         
-        self.log_display.append(formatted_msg)
-        self.log_display.verticalScrollBar().setValue(
-            self.log_display.verticalScrollBar().maximum()
-        )
+    def _flush_log(self):
+        """Write buffered log lines to the display in a single edit"""
+        if not self._log_buf:
+            return
+            
+        lines = list(self._log_buf)
+        self._log_buf.clear()
+        
+        scrollbar = self.log_display.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        document = self.log_display.document()
+        new_block = not document.isEmpty()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if new_block:
+                cursor.insertBlock()
+            cursor.insertHtml(line)
+            new_block = True
+        cursor.endEditBlock()
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
         
     def test_device(self, device_name):
         """Test individual device"""
-        if device_name in self.device_threads and self.device_threads[device_name].isRunning():
+        if device_name in self.device_threads:
             self.log_message(f"{device_name} is already active", "WARNING")
             return
             
@@ -471,14 +663,16 @@ class WorkcellControlHub(QMainWindow):
         operation = operations.get(device_name, 'Running test')
         self.log_message(f"Starting {device_name}: {operation}", "DEVICE")
         
-        # Create and start thread
-        thread = DeviceSimulationThread(device_name, operation)
-        thread.status_update.connect(self.update_device_status)
-        thread.log_message.connect(self.log_message)
-        thread.finished.connect(lambda: self.cleanup_thread(device_name))
+        # Create and start simulation
+        sim = DeviceSim(device_name, operation, self)
+        sim.status_update.connect(self.update_device_status)
+        sim.log_message.connect(self.log_message)
+        sim.finished.connect(partial(self.cleanup_thread, device_name, sim))
+        sim.finished.connect(sim.deleteLater)
         
-        self.device_threads[device_name] = thread
-        thread.start()
+        self.device_threads[device_name] = sim
+        self._operation_started()
+        sim.start()
         
     def update_device_status(self, device_name, status, progress):
         """Update device status display"""
@@ -488,44 +682,41 @@ class WorkcellControlHub(QMainWindow):
         self.devices[device_name]['status'] = status
         self.devices[device_name]['progress'] = progress
         
-        # Update label
+        # Update label (skip unchanged values to avoid relayout)
         label = self.status_labels[device_name]
-        label.setText(status)
+        if label.property('_last_status') != status:
+            label.setText(status)
+            label.setProperty('_last_status', status)
         
         # Color coding
-        if status in ['Ready', 'Idle']:
-            label.setStyleSheet(
-                "background-color: #90EE90; padding: 8px; "
-                "border-radius: 4px; min-width: 150px;"
-            )
-        elif status == 'Active':
-            label.setStyleSheet(
-                "background-color: #87CEEB; padding: 8px; "
-                "border-radius: 4px; min-width: 150px;"
-            )
-        elif status == 'Stopped':
-            label.setStyleSheet(
-                "background-color: #FFB6C6; padding: 8px; "
-                "border-radius: 4px; min-width: 150px;"
-            )
-        else:
-            label.setStyleSheet(
-                "background-color: #FFFFE0; padding: 8px; "
-                "border-radius: 4px; min-width: 150px;"
-            )
+        css = _STATUS_CSS.get(status, _CSS_YELLOW)
+        if label.property('_css') != css:
+            label.setStyleSheet(css)
+            label.setProperty('_css', css)
         
         # Update progress bar
         progress_bar = self.progress_bars[device_name]
-        if status == 'Active':
-            progress_bar.setVisible(True)
+        active = status == 'Active'
+        if progress_bar.isHidden() == active:
+            progress_bar.setVisible(active)
+        if active and progress_bar.value() != progress:
             progress_bar.setValue(progress)
-        else:
-            progress_bar.setVisible(False)
             
-    def cleanup_thread(self, device_name):
-        """Clean up finished thread"""
-        if device_name in self.device_threads:
+    def _operation_started(self):
+        """Count a new device operation, waking the periodic timer if idle"""
+        self._active_ops += 1
+        if self._active_ops == 1:
+            self.timer.start()
+        self.update_active_operations_count()
+        
+    def cleanup_thread(self, device_name, sim):
+        """Clean up finished simulation"""
+        # A newer simulation may already own this device slot
+        if self.device_threads.get(device_name) is sim:
             del self.device_threads[device_name]
+        self._active_ops = max(0, self._active_ops - 1)
+        if self._active_ops == 0:
+            self.timer.stop()
         self.update_active_operations_count()
         
     def start_protocol(self):
@@ -551,31 +742,28 @@ class WorkcellControlHub(QMainWindow):
         if not self.protocol_running:
             return
             
-        steps = [
-            ('Transport Robot', 'Retrieving samples from storage'),
-            ('Liquid Handler', 'Dispensing reagents'),
-            ('Incubator', 'Incubating samples'),
-            ('Centrifuge', 'Centrifuging samples'),
-            ('Plate Reader', 'Reading plate'),
-            ('Transport Robot', 'Returning samples to storage')
-        ]
-        
-        if self.current_step < len(steps):
+        steps = self._PROTOCOL_STEPS
+        num_steps = len(steps)
+        
+        if self.current_step < num_steps:
             device, operation = steps[self.current_step]
-            self.current_step_label.setText(f"Step {self.current_step + 1}/{len(steps)}: {operation}")
+            self.current_step_label.setText(f"Step {self.current_step + 1}/{num_steps}: {operation}")
             
-            progress = int((self.current_step / len(steps)) * 100)
+            progress = int((self.current_step / num_steps) * 100)
             self.protocol_progress.setValue(progress)
             
             # Start device operation
-            if device not in self.device_threads or not self.device_threads[device].isRunning():
-                thread = DeviceSimulationThread(device, operation)
-                thread.status_update.connect(self.update_device_status)
-                thread.log_message.connect(self.log_message)
-                thread.finished.connect(lambda: self.protocol_step_complete())
+            if device not in self.device_threads:
+                sim = DeviceSim(device, operation, self)
+                sim.status_update.connect(self.update_device_status)
+                sim.log_message.connect(self.log_message)
+                sim.finished.connect(partial(self.cleanup_thread, device, sim))
+                sim.finished.connect(self.protocol_step_complete)
+                sim.finished.connect(sim.deleteLater)
                 
-                self.device_threads[device] = thread
-                thread.start()
+                self.device_threads[device] = sim
+                self._operation_started()
+                sim.start()
             
             self.current_step += 1
         else:
@@ -583,7 +771,9 @@ class WorkcellControlHub(QMainWindow):
             
     def protocol_step_complete(self):
         """Handle completion of protocol step"""
-        if self.protocol_running and self.current_step < 6:
+        # Runs once more after the last step so execute_protocol_step can
+        # finish the protocol
+        if self.protocol_running and self.current_step <= len(self._PROTOCOL_STEPS):
             QTimer.singleShot(1000, self.execute_protocol_step)
             
     def protocol_complete(self):
@@ -597,9 +787,7 @@ class WorkcellControlHub(QMainWindow):
         self.pause_protocol_btn.setEnabled(False)
         
         # Add samples to tracking table
-        num_samples = self.sample_count.value()
-        for i in range(num_samples):
-            self.add_test_sample()
+        self._bulk_add_samples(self.sample_count.value())
         
     def pause_protocol(self):
         """Pause protocol execution"""
@@ -622,14 +810,20 @@ class WorkcellControlHub(QMainWindow):
             self.log_message("EMERGENCY STOP ACTIVATED", "ERROR")
             self.protocol_running = False
             
-            # Stop all device threads
-            for device_name, thread in self.device_threads.items():
-                thread.stop()
+            # Stop all device simulations (snapshot, since finishing
+            # simulations remove themselves from device_threads)
+            for sim in list(self.device_threads.values()):
+                sim.stop()
                 
-            # Update all device statuses
-            for device in self.devices:
-                self.devices[device]['status'] = 'Stopped'
-                self.update_device_status(device, 'Stopped', 0)
+            # Update all device statuses in a single repaint
+            central = self.centralWidget()
+            central.setUpdatesEnabled(False)
+            try:
+                for device, state in self.devices.items():
+                    if state['status'] != 'Stopped':
+                        self.update_device_status(device, 'Stopped', 0)
+            finally:
+                central.setUpdatesEnabled(True)
                 
             self.start_protocol_btn.setEnabled(True)
             self.pause_protocol_btn.setEnabled(False)
@@ -638,29 +832,17 @@ class WorkcellControlHub(QMainWindow):
             
     def add_test_sample(self):
         """Add a test sample to tracking table"""
-        sample_id = f"S{len(self.samples) + 1:04d}"
-        sample_types = ['CHO Clone', 'Media Sample', 'Assay Plate', 'QC Sample']
-        locations = ['Incubator A', 'Storage -80C', 'Workcell 1', 'Reader Station']
-        
-        sample_data = {
-            'id': sample_id,
-            'type': random.choice(sample_types),
-            'location': random.choice(locations),
-            'status': 'Active',
-            'timestamp': datetime.now().strftime("%H:%M:%S")
-        }
-        
-        self.samples.append(sample_data)
+        self._bulk_add_samples(1)
         
-        # Add to table
-        row = self.sample_table.rowCount()
-        self.sample_table.insertRow(row)
+    def _bulk_add_samples(self, n):
+        """Add n test samples to the tracking table in one model insert"""
+        base = self.samples.rowCount()
+        ids = [f"S{i:04d}" for i in range(base + 1, base + n + 1)]
+        types = random.choices(self._SAMPLE_TYPES, k=n)
+        locs = random.choices(self._LOCATIONS, k=n)
+        ts = _now_hms()
         
-        self.sample_table.setItem(row, 0, QTableWidgetItem(sample_data['id']))
-        self.sample_table.setItem(row, 1, QTableWidgetItem(sample_data['type']))
-        self.sample_table.setItem(row, 2, QTableWidgetItem(sample_data['location']))
-        self.sample_table.setItem(row, 3, QTableWidgetItem(sample_data['status']))
-        self.sample_table.setItem(row, 4, QTableWidgetItem(sample_data['timestamp']))
+        self.samples.add_many(ids, types, locs, 'Active', ts)
         
     def periodic_update(self):
         """Periodic system updates"""
@@ -668,8 +850,9 @@ class WorkcellControlHub(QMainWindow):
         
     def update_active_operations_count(self):
         """Update count of active operations"""
-        active = sum(1 for t in self.device_threads.values() if t.isRunning())
-        self.active_ops_label.setText(str(active))
+        text = str(self._active_ops)
+        if self.active_ops_label.text() != text:
+            self.active_ops_label.setText(text)
 
 
 def main():